@@ -1,50 +1,179 @@
+import os
 import sys
+import ctypes
 import platform
 import subprocess
-import psutil
+import functools
 from PyQt5.QtWidgets import (
-    QApplication, QDialog, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QWidget
+    QApplication, QDialog, QLabel, QPushButton, QVBoxLayout, QHBoxLayout
 )
 from PyQt5.QtGui import QPixmap, QFont
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QThread, QTimer, QSize
 
+# Shared by every info label, so no per-label stylesheet has to be parsed
+_INFO_FONT = QFont()
+_INFO_FONT.setPixelSize(14)
+
+_INFO_TEMPLATE = "<b>%s</b>: %s"  # Title/value line in the main dialog
+
+# Rule for the main dialog's info labels (objectName "info")
+_INFO_QSS = "QLabel#info { font-size: 14px; qproperty-alignment: AlignCenter; }"
+
+# Dialog stylesheets keyed on dark_mode
+_QSS = {
+    True: "* { background-color: #1E1E1E; color: white; }",
+    False: "* { background-color: white; color: black; }",
+}
+
+_MORE_INFO_QSS = """
+    QPushButton {
+        background-color: #E0E0E0;
+        border: none;
+        border-radius: 5px;
+        font-size: 13px;
+        padding: 5px;
+    }
+    QPushButton:hover {
+        background-color: #D0D0D0;
+    }
+    QPushButton:pressed {
+        background-color: #C0C0C0;
+    }
+"""
+
+_SYSTEM = platform.system()
+
+# Argument for GlobalMemoryStatusEx on Windows
+class _MEMORYSTATUSEX(ctypes.Structure):
+    _fields_ = [
+        ("dwLength", ctypes.c_ulong),
+        ("dwMemoryLoad", ctypes.c_ulong),
+        ("ullTotalPhys", ctypes.c_ulonglong),
+        ("ullAvailPhys", ctypes.c_ulonglong),
+        ("ullTotalPageFile", ctypes.c_ulonglong),
+        ("ullAvailPageFile", ctypes.c_ulonglong),
+        ("ullTotalVirtual", ctypes.c_ulonglong),
+        ("ullAvailVirtual", ctypes.c_ulonglong),
+        ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+    ]
+
+def _board_windows():
+    # Read baseboard product from the registry (no process spawn needed)
+    try:
+        import winreg
+        key = winreg.OpenKey(
+            winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System\BIOS"
+        )
+        with key:
+            mb_name = winreg.QueryValueEx(key, "BaseBoardProduct")[0].strip()
+        if mb_name:
+            return mb_name
+    except OSError:
+        pass
+
+    # Fall back to wmic if the registry value is missing or empty
+    cmd = ["wmic", "baseboard", "get", "product"]
+    output = subprocess.check_output(
+        cmd, shell=False, creationflags=subprocess.CREATE_NO_WINDOW
+    ).decode("mbcs")
+    lines = [line.strip() for line in output.splitlines() if line.strip()]
+    if len(lines) > 1:
+        return lines[1]
+    return "Unknown Board"
+
+def _board_linux():
+    # Read from /sys/class/dmi/id/board_name if available
+    try:
+        fd = os.open("/sys/class/dmi/id/board_name", os.O_RDONLY)
+        try:
+            return os.read(fd, 64).decode().strip()
+        finally:
+            os.close(fd)
+    except OSError:
+        return "Unknown Board"
+
+# Board name lookup for the current platform, resolved once at import
+_BOARD_FN = {
+    "Windows": _board_windows,
+    "Linux": _board_linux,
+}.get(_SYSTEM, lambda: "Unknown Board")
+
+@functools.lru_cache(maxsize=1)
 def get_motherboard_name():
     """
     Returns a shortened version of the motherboard/baseboard name if possible.
     If it can't retrieve it, returns 'Unknown Board'.
+    The result is cached, since the board can't change during a session.
     """
     try:
-        system_name = platform.system()
-        mb_name = "Unknown Board"
-
-        if system_name == "Windows":
-            # Use wmic to get baseboard product info
-            cmd = "wmic baseboard get product"
-            output = subprocess.check_output(cmd, shell=True).decode(errors="ignore")
-            lines = [line.strip() for line in output.splitlines() if line.strip()]
-            if len(lines) > 1:
-                mb_name = lines[1]
-        elif system_name == "Linux":
-            # Read from /sys/class/dmi/id/board_name if available
-            try:
-                with open("/sys/class/dmi/id/board_name", "r") as f:
-                    mb_name = f.read().strip()
-            except FileNotFoundError:
-                pass
-        else:
-            mb_name = "Unknown Board"
-
-        # Shorten if necessary
-        if len(mb_name) > 20:
-            mb_name = mb_name[:20] + "..."
-
-        return mb_name
-
+        mb_name = _BOARD_FN()
     except Exception:
         return "Unknown Board"
 
-class MoreInfoWindow(QDialog):
+    # Shorten if necessary
+    return mb_name[:20] + "..." if len(mb_name) > 20 else mb_name
+
+def _total_ram_gb():
+    """
+    Returns the total physical memory in GB, or None if it can't be read.
+    Only the total is queried, instead of building the full memory stats.
+    """
+    if _SYSTEM == "Windows":
+        status = _MEMORYSTATUSEX()
+        status.dwLength = ctypes.sizeof(_MEMORYSTATUSEX)
+        if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return None
+        total = status.ullTotalPhys
+    else:
+        total = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    return total // (1024**3)
+
+@functools.lru_cache(maxsize=1)
+def _cpu_name():
+    """
+    Returns the CPU model name from /proc/cpuinfo if available,
+    falling back to platform.processor().
+    """
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or "Unknown CPU"
+
+@functools.lru_cache(maxsize=1)
+def _sysinfo():
+    """
+    Collects OS, CPU and memory info once and shares it between both dialogs.
+    """
+    mem_gb = _total_ram_gb()
+    return {
+        "os": _SYSTEM + " " + platform.release(),
+        "cpu": _cpu_name(),
+        "memory": "Unknown" if mem_gb is None else f"{mem_gb} GB",
+    }
+
+class SysInfoWorker(QObject):
+    ready = pyqtSignal(dict)  # Emitted with the collected system info
+
+    def run(self):
+        """
+        Collects the slow system info (board name, CPU, memory, OS).
+        Meant to run in a background QThread so the dialog can paint first.
+        """
+        self.ready.emit(dict(_sysinfo(), mb=get_motherboard_name()))
+
+class _DarkModeMixin:
+    _extra_qss = ""  # Dialog-specific rules kept across dark mode changes
+
+    def apply_dark_mode(self):
+        self.setStyleSheet(_QSS[self.dark_mode] + " " + self._extra_qss)
+
+class MoreInfoWindow(QDialog, _DarkModeMixin):
     dark_mode_changed = pyqtSignal(bool)  # Signal to notify about dark mode change
+    _os_pixmap = None  # Decoded once, shared by every window
 
     def __init__(self, parent=None, dark_mode=False):
         super().__init__(parent)
@@ -52,6 +181,8 @@ class MoreInfoWindow(QDialog):
         self.setFixedSize(700, 400)
         
         self.dark_mode = dark_mode
+        self._applied_dark_mode = dark_mode  # Last value styled and sent to the parent
+        self._restyle_pending = False
         self.apply_dark_mode()
 
         main_layout = QHBoxLayout()
@@ -59,17 +190,17 @@ class MoreInfoWindow(QDialog):
         main_layout.setSpacing(15)
         
         image_label = QLabel(self)
-        pixmap = QPixmap("Os.png")
-        image_label.setPixmap(pixmap)
+        image_label.setPixmap(self.os_pixmap())
         image_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(image_label)
         
         text_layout = QVBoxLayout()
         text_layout.setSpacing(10)
         
-        os_version = platform.system() + " " + platform.release()
-        cpu_info = platform.processor() or "Unknown CPU"
-        memory_info = f"{int(psutil.virtual_memory().total / (1024**3))} GB"
+        info = _sysinfo()
+        os_version = info["os"]
+        cpu_info = info["cpu"]
+        memory_info = info["memory"]
         disk_info = "System Drive"
         display_info = "Unknown Display"
         graphics_info = "Unknown GPU"
@@ -85,10 +216,14 @@ class MoreInfoWindow(QDialog):
             ("Bootloader", bootloader_info)
         ]
         
-        for title, value in info_texts:
-            label = QLabel(f"<b>{title}:</b> {value}")
-            label.setStyleSheet("font-size: 14px;")
-            text_layout.addWidget(label)
+        # One rich-text label instead of one widget per line
+        info_html = "".join(
+            f"<p style='margin: 4px 0'><b>{title}:</b> {value}</p>"
+            for title, value in info_texts
+        )
+        info_label = QLabel(info_html)
+        info_label.setFont(_INFO_FONT)
+        text_layout.addWidget(info_label)
         
         text_layout.addStretch()
         
@@ -108,39 +243,60 @@ class MoreInfoWindow(QDialog):
         main_layout.addLayout(text_layout)
         self.setLayout(main_layout)
     
+    @classmethod
+    def os_pixmap(cls):
+        """
+        Returns the Os.png pixmap, decoding it on first use.
+        """
+        if cls._os_pixmap is None:
+            cls._os_pixmap = QPixmap("Os.png")
+        return cls._os_pixmap
+
     def toggle_dark_mode(self):
         self.dark_mode = not self.dark_mode
+        # Coalesce rapid toggles into a single restyle
+        if not self._restyle_pending:
+            self._restyle_pending = True
+            QTimer.singleShot(50, self._flush_restyle)
+
+    def _flush_restyle(self):
+        self._restyle_pending = False
+        # An even number of toggles ends where it started, nothing to do
+        if self.dark_mode == self._applied_dark_mode:
+            return
+        self._applied_dark_mode = self.dark_mode
         self.apply_dark_mode()
         self.dark_mode_changed.emit(self.dark_mode)  # Emit signal to parent window
 
-    def apply_dark_mode(self):
-        if self.dark_mode:
-            self.setStyleSheet("background-color: #1E1E1E; color: white;")
-        else:
-            self.setStyleSheet("background-color: white; color: black;")
+class AboutThisMac(QDialog, _DarkModeMixin):
+    _extra_qss = _INFO_QSS
+    _device_pixmap = None  # Decoded and scaled once, shared by every dialog
 
-class AboutThisMac(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("About This Mac (Replica)")
         self.setFixedSize(400, 550)
 
         self.dark_mode = False  # Start with light mode
+        self.setStyleSheet(self._extra_qss)  # Native palette until dark mode is toggled
         
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(20, 20, 20, 20)
 
         # 1. Top Image (Laptop placeholder)
         self.laptop_label = QLabel()
-        pixmap = QPixmap("device.png")
-        pixmap = pixmap.scaled(200, 120, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.laptop_label.setPixmap(pixmap)
+        if type(self)._device_pixmap is None:
+            pixmap = QPixmap("device.png")
+            # Skip the resample if the image is already pre-rendered at 200x120
+            if pixmap.size() != QSize(200, 120):
+                pixmap = pixmap.scaled(200, 120, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            type(self)._device_pixmap = pixmap
+        self.laptop_label.setPixmap(type(self)._device_pixmap)
         self.laptop_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(self.laptop_label)
 
-        # 2. Motherboard name as title
-        mb_name = get_motherboard_name()
-        self.mac_title = QLabel(mb_name)
+        # 2. Motherboard name as title (filled in by _populate)
+        self.mac_title = QLabel("Loading\u2026")
         font_title = QFont("Arial", 18, QFont.Bold)
         self.mac_title.setFont(font_title)
         self.mac_title.setAlignment(Qt.AlignCenter)
@@ -150,56 +306,62 @@ class AboutThisMac(QDialog):
         info_layout = QVBoxLayout()
         info_layout.setSpacing(8)
 
-        cpu_info = platform.processor() or "Unknown CPU"
-        total_memory = psutil.virtual_memory().total / (1024**3)
-        os_info = platform.system() + " " + platform.release()
         serial_number = "X0ZYZ1ZYZX"
         startup_disk = "System Drive"
 
-        chip_label = QLabel(f"<b>Chip</b>: {cpu_info}")
-        memory_label = QLabel(f"<b>Memory</b>: {int(total_memory)} GB")
-        startup_label = QLabel(f"<b>Startup disk</b>: {startup_disk}")
-        serial_label = QLabel(f"<b>Serial number</b>: {serial_number}")
-        os_label = QLabel(f"<b>OS</b>: {os_info}")
+        info_texts = [
+            ("Chip", "Loading\u2026"),
+            ("Memory", "Loading\u2026"),
+            ("Startup disk", startup_disk),
+            ("Serial number", serial_number),
+            ("OS", "Loading\u2026"),
+        ]
+        labels = [QLabel(_INFO_TEMPLATE % pair) for pair in info_texts]
+        self.chip_label, self.memory_label, _, _, self.os_label = labels
 
-        for lbl in [chip_label, memory_label, startup_label, serial_label, os_label]:
-            lbl.setStyleSheet("font-size: 14px;")
-            lbl.setAlignment(Qt.AlignCenter)
+        for lbl in labels:
+            lbl.setObjectName("info")
             info_layout.addWidget(lbl)
 
-        info_widget = QWidget()
-        info_widget.setLayout(info_layout)
-        main_layout.addWidget(info_widget, 0, Qt.AlignCenter)
+        main_layout.addLayout(info_layout)
 
         # 4. “More Info...” button with macOS style (no border)
         self.more_info_button = QPushButton("More Info...")
         self.more_info_button.setFixedSize(120, 30)
-        self.more_info_button.setStyleSheet("""
-            QPushButton {
-                background-color: #E0E0E0;
-                border: none;
-                border-radius: 5px;
-                font-size: 13px;
-                padding: 5px;
-            }
-            QPushButton:hover {
-                background-color: #D0D0D0;
-            }
-            QPushButton:pressed {
-                background-color: #C0C0C0;
-            }
-        """)
+        self.more_info_button.setStyleSheet(_MORE_INFO_QSS)
         self.more_info_button.clicked.connect(self.show_more_info)
         main_layout.addWidget(self.more_info_button, 0, Qt.AlignCenter)
 
         self.setLayout(main_layout)
 
+        # 5. Collect system info in the background so the first paint isn't blocked
+        self._thread = QThread(self)
+        self._worker = SysInfoWorker()
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.run)
+        self._worker.ready.connect(self._populate)
+        self._worker.ready.connect(self._thread.quit)
+        self._thread.finished.connect(self._worker.deleteLater)
+        self.finished.connect(lambda _: self._thread.wait())
+        self._thread.start()
+
+        # Decode the More Info image while idle so the first click doesn't pay for it
+        QTimer.singleShot(500, MoreInfoWindow.os_pixmap)
+
+    def _populate(self, info):
+        self.mac_title.setText(info["mb"])
+        self.chip_label.setText(_INFO_TEMPLATE % ("Chip", info["cpu"]))
+        self.memory_label.setText(_INFO_TEMPLATE % ("Memory", info["memory"]))
+        self.os_label.setText(_INFO_TEMPLATE % ("OS", info["os"]))
+
     def show_more_info(self):
         self.more_info_window = MoreInfoWindow(self, self.dark_mode)
         self.more_info_window.dark_mode_changed.connect(self.update_dark_mode)  # Connect signal
         self.more_info_window.exec_()
 
     def update_dark_mode(self, dark_mode):
+        if dark_mode == self.dark_mode:
+            return
         self.dark_mode = dark_mode
         self.apply_dark_mode()
 
@@ -207,12 +369,6 @@ class AboutThisMac(QDialog):
         self.dark_mode = not self.dark_mode
         self.apply_dark_mode()
 
-    def apply_dark_mode(self):
-        if self.dark_mode:
-            self.setStyleSheet("background-color: #1E1E1E; color: white;")
-        else:
-            self.setStyleSheet("background-color: white; color: black;")
-
 def main():
     app = QApplication(sys.argv)
     about_dialog = AboutThisMac()